@@ -4,6 +4,7 @@ use anyhow::Result;
 use clap::Subcommand;
 use colored::Colorize;
 use comfy_table::{ContentArrangement, Table};
+use dialoguer::Confirm;
 use treeline_core::LogEvent;
 
 use super::{get_context, get_logger, get_treeline_dir, log_event};
@@ -74,7 +75,7 @@ pub fn run(command: BackupCommands) -> Result<()> {
                 Ok(result) => {
                     log_event(&logger, LogEvent::new("backup_completed").with_command("backup create"));
                     if json {
-                        println!("{}", serde_json::to_string_pretty(&result)?);
+                        println!("{}", serde_json::to_string(&result)?);
                     } else {
                         println!("{}", "Backup created".green());
                         println!("  Name: {}", result.name);
@@ -98,7 +99,7 @@ pub fn run(command: BackupCommands) -> Result<()> {
             let backups = backup_service.list()?;
 
             if json {
-                println!("{}", serde_json::to_string_pretty(&backups)?);
+                println!("{}", serde_json::to_string(&backups)?);
                 return Ok(());
             }
 
@@ -126,7 +127,6 @@ pub fn run(command: BackupCommands) -> Result<()> {
             // Restore doesn't need database access - it replaces the database
             let backup_service = get_backup_service();
             if !force && !json {
-                use dialoguer::Confirm;
                 if !Confirm::new()
                     .with_prompt(format!("Restore from backup '{}'?", name))
                     .default(false)
@@ -160,7 +160,6 @@ pub fn run(command: BackupCommands) -> Result<()> {
             // Clear doesn't need database access
             let backup_service = get_backup_service();
             if !force && !json {
-                use dialoguer::Confirm;
                 if !Confirm::new()
                     .with_prompt("Delete all backups?")
                     .default(false)
@@ -33,7 +33,7 @@ pub fn run(skip_backup: bool, json: bool) -> Result<()> {
             compacted_size: result.compacted_size,
             backup_name,
         };
-        println!("{}", serde_json::to_string_pretty(&output)?);
+        println!("{}", serde_json::to_string(&output)?);
         return Ok(());
     }
 
@@ -4,7 +4,7 @@ use anyhow::Result;
 use clap::Subcommand;
 use colored::Colorize;
 
-use super::get_treeline_dir;
+use super::{ensure_treeline_dir, get_treeline_dir};
 use treeline_core::services::DemoService;
 
 #[derive(Subcommand)]
@@ -21,7 +21,7 @@ pub enum DemoCommands {
 
 pub fn run(command: Option<DemoCommands>) -> Result<()> {
     let treeline_dir = get_treeline_dir();
-    std::fs::create_dir_all(&treeline_dir)?;
+    ensure_treeline_dir(&treeline_dir)?;
     let demo_service = DemoService::new(&treeline_dir);
 
     match command {
@@ -5,7 +5,7 @@ use colored::Colorize;
 use comfy_table::{Table, ContentArrangement, Cell, Color};
 use serde_json::Value;
 
-use super::get_context;
+use super::{exit_status, get_context};
 
 /// Format a detail JSON value for display
 fn format_detail(value: &Value) -> String {
@@ -61,7 +61,7 @@ pub fn run(verbose: bool, json: bool) -> Result<()> {
     let result = ctx.doctor_service.run_checks()?;
 
     if json {
-        println!("{}", serde_json::to_string_pretty(&result)?);
+        println!("{}", serde_json::to_string(&result)?);
         return Ok(());
     }
 
@@ -113,7 +113,7 @@ pub fn run(verbose: bool, json: bool) -> Result<()> {
     );
 
     if result.summary.errors > 0 {
-        std::process::exit(1);
+        return Err(exit_status(1));
     }
 
     Ok(())
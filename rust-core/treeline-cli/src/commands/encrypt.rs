@@ -8,7 +8,7 @@ use colored::Colorize;
 use dialoguer::{Confirm, Password};
 use treeline_core::LogEvent;
 
-use super::{get_logger, log_event};
+use super::{exit_status, get_logger, log_event};
 use treeline_core::config::Config;
 use treeline_core::services::{BackupService, EncryptionService};
 
@@ -80,7 +80,7 @@ pub fn run(command: Option<EncryptCommands>, password: Option<String>, json: boo
                 eprintln!("{}", "Cannot encrypt demo database".red());
                 eprintln!("{}", "Demo mode uses a separate, unencrypted database".dimmed());
             }
-            std::process::exit(1);
+            return Err(exit_status(1));
         }
     }
 
@@ -89,7 +89,7 @@ pub fn run(command: Option<EncryptCommands>, password: Option<String>, json: boo
             let status = encryption_service.get_status()?;
 
             if json {
-                println!("{}", serde_json::to_string_pretty(&status)?);
+                println!("{}", serde_json::to_string(&status)?);
             } else {
                 if status.encrypted {
                     println!("{}", "Database is encrypted".green());
@@ -129,7 +129,7 @@ pub fn run(command: Option<EncryptCommands>, password: Option<String>, json: boo
                 Ok(result) => {
                     log_event(&logger, LogEvent::new("encrypt_completed").with_command("encrypt"));
                     if json {
-                        println!("{}", serde_json::to_string_pretty(&result)?);
+                        println!("{}", serde_json::to_string(&result)?);
                     } else {
                         println!("{}", "Database encrypted successfully".green());
                         if let Some(backup_name) = result.backup_name {
@@ -174,7 +174,7 @@ pub fn run_decrypt(password: Option<String>, json: bool) -> Result<()> {
         } else {
             eprintln!("{}", "Demo database is not encrypted".red());
         }
-        std::process::exit(1);
+        return Err(exit_status(1));
     }
 
     if !encryption_service.is_encrypted()? {
@@ -189,7 +189,7 @@ pub fn run_decrypt(password: Option<String>, json: bool) -> Result<()> {
         Ok(result) => {
             log_event(&logger, LogEvent::new("decrypt_completed").with_command("decrypt"));
             if json {
-                println!("{}", serde_json::to_string_pretty(&result)?);
+                println!("{}", serde_json::to_string(&result)?);
             } else {
                 println!("{}", "Database decrypted successfully".green());
                 if let Some(backup_name) = result.backup_name {
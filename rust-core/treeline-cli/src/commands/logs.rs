@@ -1,9 +1,11 @@
 //! Logs command - view and manage application logs
 
 use anyhow::Result;
+use chrono::{TimeZone, Utc};
 use clap::Subcommand;
 use colored::Colorize;
 use comfy_table::{ContentArrangement, Table};
+use dialoguer::Confirm;
 
 use super::get_treeline_dir;
 use treeline_core::{EntryPoint, LoggingService};
@@ -48,7 +50,6 @@ fn get_logging_service() -> Result<LoggingService> {
 }
 
 fn format_timestamp(timestamp_ms: i64) -> String {
-    use chrono::{TimeZone, Utc};
     Utc.timestamp_millis_opt(timestamp_ms)
         .single()
         .map(|dt| dt.format("%Y-%m-%d %H:%M:%S").to_string())
@@ -66,7 +67,7 @@ pub fn run(command: LogsCommands) -> Result<()> {
             };
 
             if json {
-                println!("{}", serde_json::to_string_pretty(&entries)?);
+                println!("{}", serde_json::to_string(&entries)?);
                 return Ok(());
             }
 
@@ -136,7 +137,6 @@ pub fn run(command: LogsCommands) -> Result<()> {
                 - (older_than_days as i64 * 24 * 60 * 60 * 1000);
 
             if !force && !json {
-                use dialoguer::Confirm;
                 if !Confirm::new()
                     .with_prompt(format!(
                         "Delete logs older than {} days?",
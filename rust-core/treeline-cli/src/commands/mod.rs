@@ -8,22 +8,47 @@ pub mod encrypt;
 pub mod logs;
 pub mod plugin;
 pub mod query;
+pub mod repl;
 pub mod status;
 pub mod sync;
 pub mod tag;
 
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 use anyhow::{Context, Result};
 use treeline_core::services::EncryptionService;
 use treeline_core::{EntryPoint, LogEvent, LoggingService, TreelineContext};
 
+/// A non-zero exit status from a command that already reported its outcome
+///
+/// Commands that print a structured result (tag failures, doctor errors,
+/// plugin install problems) signal the failure through this error instead of
+/// calling std::process::exit. main() maps it to the process exit code
+/// without printing anything extra, and `tl repl` maps it to the returncode
+/// envelope - exiting directly would kill the whole repl session.
+#[derive(Debug)]
+pub struct ExitStatus(pub u8);
+
+impl std::fmt::Display for ExitStatus {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        write!(f, "exit status {}", self.0)
+    }
+}
+
+impl std::error::Error for ExitStatus {}
+
+/// Bail out of a command with the given exit code, output already printed
+pub fn exit_status(code: u8) -> anyhow::Error {
+    anyhow::Error::new(ExitStatus(code))
+}
+
 /// Get the logging service for CLI operations
 ///
 /// Returns None if logging fails to initialize (shouldn't block operations)
 pub fn get_logger() -> Option<LoggingService> {
     let treeline_dir = get_treeline_dir();
     // Ensure directory exists
-    std::fs::create_dir_all(&treeline_dir).ok()?;
+    ensure_treeline_dir(&treeline_dir).ok()?;
     LoggingService::new(&treeline_dir, EntryPoint::Cli, env!("CARGO_PKG_VERSION")).ok()
 }
 
@@ -35,14 +60,37 @@ pub fn log_event(logger: &Option<LoggingService>, event: LogEvent) {
 }
 
 /// Get the treeline directory from environment or default
+///
+/// Resolved once per process: the env var and home directory can't change
+/// under a running CLI invocation, so repeat callers get a clone of the
+/// cached path instead of re-doing the env/home lookup.
 pub fn get_treeline_dir() -> PathBuf {
-    if let Ok(dir) = std::env::var("TREELINE_DIR") {
-        PathBuf::from(dir)
-    } else {
-        dirs::home_dir()
-            .expect("Could not find home directory")
-            .join(".treeline")
+    static TREELINE_DIR: OnceLock<PathBuf> = OnceLock::new();
+    TREELINE_DIR
+        .get_or_init(|| {
+            if let Ok(dir) = std::env::var("TREELINE_DIR") {
+                PathBuf::from(dir)
+            } else {
+                dirs::home_dir()
+                    .expect("Could not find home directory")
+                    .join(".treeline")
+            }
+        })
+        .clone()
+}
+
+/// Create the treeline directory if needed, once per process
+///
+/// create_dir_all costs a stat syscall even when the directory already
+/// exists; several entry points (logger, context, demo) each issued their
+/// own, so guard it behind a process-wide flag.
+pub fn ensure_treeline_dir(treeline_dir: &Path) -> std::io::Result<()> {
+    static CREATED: OnceLock<()> = OnceLock::new();
+    if CREATED.get().is_none() {
+        std::fs::create_dir_all(treeline_dir)?;
+        let _ = CREATED.set(());
     }
+    Ok(())
 }
 
 /// Get or create treeline context
@@ -50,7 +98,7 @@ pub fn get_context() -> Result<TreelineContext> {
     let treeline_dir = get_treeline_dir();
 
     // Create directory if it doesn't exist
-    std::fs::create_dir_all(&treeline_dir)
+    ensure_treeline_dir(&treeline_dir)
         .with_context(|| format!("Failed to create treeline directory: {:?}", treeline_dir))?;
 
     // Determine encryption key
@@ -6,7 +6,7 @@ use anyhow::Result;
 use clap::Subcommand;
 use colored::Colorize;
 
-use super::get_treeline_dir;
+use super::{exit_status, get_treeline_dir};
 use treeline_core::services::PluginService;
 
 #[derive(Subcommand)]
@@ -59,7 +59,7 @@ pub fn run(command: PluginCommands) -> Result<()> {
 
             if !result.success {
                 eprintln!("{}", format!("Error: {}", result.error.unwrap_or_default()).red());
-                std::process::exit(1);
+                return Err(exit_status(1));
             }
 
             let plugin_dir = result.install_dir.unwrap_or_default();
@@ -85,11 +85,11 @@ pub fn run(command: PluginCommands) -> Result<()> {
                 } else {
                     eprintln!("{}", format!("Error: {}", result.error.unwrap_or_default()).red());
                 }
-                std::process::exit(1);
+                return Err(exit_status(1));
             }
 
             if json {
-                println!("{}", serde_json::to_string_pretty(&serde_json::json!({
+                println!("{}", serde_json::to_string(&serde_json::json!({
                     "success": true,
                     "plugin_id": result.plugin_id,
                     "plugin_name": result.plugin_name,
@@ -125,11 +125,11 @@ pub fn run(command: PluginCommands) -> Result<()> {
                 } else {
                     eprintln!("{}", format!("Error: {}", result.error.unwrap_or_default()).red());
                 }
-                std::process::exit(1);
+                return Err(exit_status(1));
             }
 
             if json {
-                println!("{}", serde_json::to_string_pretty(&serde_json::json!({
+                println!("{}", serde_json::to_string(&serde_json::json!({
                     "success": true,
                     "plugin_id": result.plugin_id,
                     "plugin_name": result.plugin_name
@@ -143,7 +143,7 @@ pub fn run(command: PluginCommands) -> Result<()> {
             let plugins = plugin_service.list_plugins()?;
 
             if json {
-                println!("{}", serde_json::to_string_pretty(&serde_json::json!({
+                println!("{}", serde_json::to_string(&serde_json::json!({
                     "success": true,
                     "plugins": plugins
                 }))?);
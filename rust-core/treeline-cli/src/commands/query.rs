@@ -7,15 +7,23 @@ use anyhow::{Context, Result};
 use comfy_table::{Table, ContentArrangement};
 
 use super::get_context;
+use treeline_core::services::QueryService;
+use treeline_core::QueryResult;
 
-pub fn run(sql: Option<&str>, file: Option<&Path>, format: &str) -> Result<()> {
+pub fn run(
+    sql: Option<&str>,
+    file: Option<&Path>,
+    format: &str,
+    params: &[String],
+    stdin_available: bool,
+) -> Result<()> {
     // Get SQL from: argument, file, or stdin
     let sql_content = if let Some(sql) = sql {
         sql.to_string()
     } else if let Some(file_path) = file {
         std::fs::read_to_string(file_path)
             .with_context(|| format!("Failed to read SQL file: {:?}", file_path))?
-    } else if atty::isnt(atty::Stream::Stdin) {
+    } else if stdin_available && atty::isnt(atty::Stream::Stdin) {
         // Read from stdin if not a TTY
         let mut buffer = String::new();
         io::stdin().read_to_string(&mut buffer)
@@ -26,11 +34,61 @@ pub fn run(sql: Option<&str>, file: Option<&Path>, format: &str) -> Result<()> {
     };
 
     let ctx = get_context()?;
+
+    // Parameterized queries: bind values to ? placeholders instead of
+    // interpolating them into the SQL, so callers can reuse one query
+    // string across invocations and skip shell quoting of values.
+    if !params.is_empty() {
+        let values: Vec<serde_json::Value> = params
+            .iter()
+            .map(|p| {
+                serde_json::from_str(p)
+                    .unwrap_or_else(|_| serde_json::Value::String(p.clone()))
+            })
+            .collect();
+        let result = ctx.query_service.execute_with_params(&sql_content, &values)?;
+        return print_result(&result, format);
+    }
+
+    // `;`-separated scripts run as a batch: one process start and database
+    // open for N statements instead of N CLI invocations. The split is
+    // quote-aware, so a single statement containing ';' in a literal is
+    // executed as-is.
+    let statement_count = QueryService::split_statements(&sql_content).len();
+
+    if statement_count > 1 {
+        let results = ctx.query_service.execute_script(&sql_content)?;
+        if format == "json" {
+            println!(
+                "{}",
+                serde_json::to_string(&serde_json::json!({ "results": results }))?
+            );
+        } else {
+            for result in &results {
+                print_result(result, format)?;
+            }
+        }
+        return Ok(());
+    }
+
     let result = ctx.query_service.execute(&sql_content)?;
+    print_result(&result, format)?;
+
+    Ok(())
+}
 
+fn print_result(result: &QueryResult, format: &str) -> Result<()> {
     match format {
         "json" => {
-            println!("{}", serde_json::to_string_pretty(&result)?);
+            println!("{}", serde_json::to_string(&result)?);
+        }
+        "raw" => {
+            // First cell only, as a bare line: lets scalar queries
+            // (SELECT COUNT(*), id lookups) skip the JSON envelope and its
+            // parse on the consumer side.
+            if let Some(value) = result.rows.first().and_then(|row| row.first()) {
+                println!("{}", value_to_string(value));
+            }
         }
         "csv" => {
             // CSV output
@@ -0,0 +1,156 @@
+//! Repl command - run many CLI invocations in one long-lived process
+//!
+//! Spawning `tl` per command pays binary startup, settings parsing and
+//! database open every time, which dominates when a caller (test harness,
+//! desktop app, script) issues dozens of small commands. `tl repl` reads
+//! newline-delimited JSON requests from stdin:
+//!
+//! ```text
+//! {"argv": ["status", "--json"]}
+//! ```
+//!
+//! runs each through the normal command dispatch, and terminates every
+//! command's output with an envelope line prefixed by the ASCII record
+//! separator (0x1e) so it can never be confused with command output:
+//!
+//! ```text
+//! \x1e{"returncode":0}
+//! ```
+//!
+//! The session ends at EOF on stdin.
+
+use std::io::{self, BufRead, Write};
+
+use anyhow::Result;
+use serde::Deserialize;
+
+use super::ExitStatus;
+
+/// A single repl request: the argv that would follow `tl` on a command line
+#[derive(Deserialize)]
+struct ReplRequest {
+    argv: Vec<String>,
+}
+
+pub fn run(dispatch: impl Fn(Vec<String>) -> Result<()>) -> Result<()> {
+    let stdin = io::stdin();
+    let stdout = io::stdout();
+    run_session(stdin.lock(), stdout.lock(), dispatch)
+}
+
+/// The repl loop, generic over IO so tests can drive it with buffers
+fn run_session(
+    input: impl BufRead,
+    mut output: impl Write,
+    dispatch: impl Fn(Vec<String>) -> Result<()>,
+) -> Result<()> {
+    for line in input.lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let returncode = match serde_json::from_str::<ReplRequest>(&line) {
+            Ok(req) if req.argv.first().map(String::as_str) == Some("repl") => {
+                eprintln!("repl: cannot nest repl sessions");
+                2
+            }
+            Ok(req) => match dispatch(req.argv) {
+                Ok(()) => 0,
+                // Command printed its outcome and signalled the code;
+                // anything else is an unreported error worth showing.
+                Err(e) => match e.downcast_ref::<ExitStatus>() {
+                    Some(ExitStatus(code)) => i32::from(*code),
+                    None => {
+                        eprintln!("{}", e);
+                        1
+                    }
+                },
+            },
+            Err(e) => {
+                eprintln!("repl: invalid request: {}", e);
+                2
+            }
+        };
+
+        writeln!(output, "\x1e{{\"returncode\":{}}}", returncode)?;
+        output.flush()?;
+    }
+
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Run a session over in-memory IO and return the emitted envelope lines
+    fn session(input: &str, dispatch: impl Fn(Vec<String>) -> Result<()>) -> Vec<String> {
+        let mut output = Vec::new();
+        run_session(input.as_bytes(), &mut output, dispatch).unwrap();
+        String::from_utf8(output)
+            .unwrap()
+            .lines()
+            .map(|l| l.to_string())
+            .collect()
+    }
+
+    #[test]
+    fn test_emits_envelope_per_request() {
+        let lines = session(
+            "{\"argv\": [\"status\"]}\n\n{\"argv\": [\"status\", \"--json\"]}\n",
+            |_| Ok(()),
+        );
+        assert_eq!(
+            lines,
+            vec!["\x1e{\"returncode\":0}", "\x1e{\"returncode\":0}"]
+        );
+    }
+
+    #[test]
+    fn test_command_error_keeps_session_alive() {
+        // A failing command must still produce an envelope and must not end
+        // the session - later requests are processed normally.
+        let lines = session(
+            "{\"argv\": [\"tag\"]}\n{\"argv\": [\"status\"]}\n",
+            |argv| {
+                if argv[0] == "tag" {
+                    anyhow::bail!("Transaction not found")
+                }
+                Ok(())
+            },
+        );
+        assert_eq!(
+            lines,
+            vec!["\x1e{\"returncode\":1}", "\x1e{\"returncode\":0}"]
+        );
+    }
+
+    #[test]
+    fn test_exit_status_maps_to_returncode() {
+        let lines = session("{\"argv\": [\"doctor\"]}\n", |_| {
+            Err(anyhow::Error::new(ExitStatus(1)))
+        });
+        assert_eq!(lines, vec!["\x1e{\"returncode\":1}"]);
+    }
+
+    #[test]
+    fn test_invalid_request_returns_2() {
+        let lines = session("not json\n{\"argv\": []}\n", |argv| {
+            assert!(argv.is_empty());
+            Ok(())
+        });
+        assert_eq!(
+            lines,
+            vec!["\x1e{\"returncode\":2}", "\x1e{\"returncode\":0}"]
+        );
+    }
+
+    #[test]
+    fn test_nested_repl_is_rejected() {
+        let lines = session("{\"argv\": [\"repl\"]}\n", |_| {
+            panic!("nested repl must not dispatch")
+        });
+        assert_eq!(lines, vec!["\x1e{\"returncode\":2}"]);
+    }
+}
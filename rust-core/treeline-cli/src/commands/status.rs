@@ -11,7 +11,7 @@ pub fn run(json: bool) -> Result<()> {
     let status = ctx.status_service.get_status()?;
 
     if json {
-        println!("{}", serde_json::to_string_pretty(&status)?);
+        println!("{}", serde_json::to_string(&status)?);
         return Ok(());
     }
 
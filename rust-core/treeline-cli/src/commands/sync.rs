@@ -48,7 +48,7 @@ pub fn run(integration: Option<String>, dry_run: bool, json: bool) -> Result<()>
     let result = result?;
 
     if json {
-        println!("{}", serde_json::to_string_pretty(&result)?);
+        println!("{}", serde_json::to_string(&result)?);
         return Ok(());
     }
 
@@ -1,14 +1,19 @@
 //! Tag command - apply tags to transactions
 
 use std::io::{self, Read};
-use std::process::exit;
 
 use anyhow::Result;
 use colored::Colorize;
 
-use super::get_context;
+use super::{exit_status, get_context};
 
-pub fn run(tags: &str, ids: Vec<String>, replace: bool, json: bool) -> Result<()> {
+pub fn run(
+    tags: &str,
+    ids: Vec<String>,
+    replace: bool,
+    json: bool,
+    stdin_available: bool,
+) -> Result<()> {
     let ctx = get_context()?;
 
     let tag_list: Vec<String> = tags.split(',')
@@ -17,7 +22,7 @@ pub fn run(tags: &str, ids: Vec<String>, replace: bool, json: bool) -> Result<()
         .collect();
 
     // Get IDs from argument or stdin
-    let id_list: Vec<String> = if ids.is_empty() && atty::isnt(atty::Stream::Stdin) {
+    let id_list: Vec<String> = if ids.is_empty() && stdin_available && atty::isnt(atty::Stream::Stdin) {
         // Read from stdin
         let mut buffer = String::new();
         io::stdin().read_to_string(&mut buffer)?;
@@ -48,10 +53,10 @@ pub fn run(tags: &str, ids: Vec<String>, replace: bool, json: bool) -> Result<()
     let result = ctx.tag_service.apply_tags(&id_list, &tag_list, replace)?;
 
     if json {
-        println!("{}", serde_json::to_string_pretty(&result)?);
+        println!("{}", serde_json::to_string(&result)?);
         // Exit with code 1 if any errors (matches Python behavior)
         if result.failed > 0 {
-            exit(1);
+            return Err(exit_status(1));
         }
         return Ok(());
     }
@@ -71,7 +76,7 @@ pub fn run(tags: &str, ids: Vec<String>, replace: bool, json: bool) -> Result<()
             }
         }
         // Exit with code 1 if any errors (matches Python behavior)
-        exit(1);
+        return Err(exit_status(1));
     }
 
     Ok(())
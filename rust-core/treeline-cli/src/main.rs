@@ -9,7 +9,7 @@ use clap::{Parser, Subcommand};
 mod commands;
 mod output;
 
-use commands::{backup, compact, demo, doctor, encrypt, logs, plugin, query, status, sync, tag};
+use commands::{backup, compact, demo, doctor, encrypt, logs, plugin, query, repl, status, sync, tag};
 
 /// Treeline - personal finance in your terminal
 #[derive(Parser)]
@@ -53,6 +53,12 @@ enum Commands {
         /// Output as JSON (shorthand for --format json)
         #[arg(long)]
         json: bool,
+        /// Output only the first cell as plain text (shorthand for --format raw)
+        #[arg(long)]
+        raw: bool,
+        /// Value to bind to a ? placeholder (repeatable, bound in order)
+        #[arg(long = "param")]
+        params: Vec<String>,
     },
 
     /// Apply tags to transactions
@@ -136,31 +142,56 @@ enum Commands {
         #[command(subcommand)]
         command: logs::LogsCommands,
     },
+
+    /// Run commands from stdin in one process (newline-delimited JSON)
+    ///
+    /// Each input line is {"argv": [...]}; each command's output is followed
+    /// by a record-separator-prefixed {"returncode": N} envelope line.
+    /// Lets harnesses amortize process startup across many commands.
+    Repl,
 }
 
 fn main() -> ExitCode {
     let cli = Cli::parse();
 
-    let result = run(cli);
+    let result = run(cli, true);
 
     match result {
         Ok(()) => ExitCode::SUCCESS,
-        Err(e) => {
-            eprintln!("{}", e);
-            ExitCode::FAILURE
-        }
+        // Commands that already printed their outcome signal the code via
+        // ExitStatus; anything else is an unreported error worth showing.
+        Err(e) => match e.downcast_ref::<commands::ExitStatus>() {
+            Some(commands::ExitStatus(code)) => ExitCode::from(*code),
+            None => {
+                eprintln!("{}", e);
+                ExitCode::FAILURE
+            }
+        },
     }
 }
 
-fn run(cli: Cli) -> Result<()> {
+/// Dispatch a parsed command line
+///
+/// `stdin_available` is false inside a repl session, where stdin carries the
+/// request stream: commands that would otherwise read piped input (query SQL,
+/// tag ids) must not touch it or they deadlock the session.
+fn run(cli: Cli, stdin_available: bool) -> Result<()> {
     match cli.command {
         Commands::Status { json } => status::run(json),
         Commands::Sync { integration, dry_run, json } => sync::run(integration, dry_run, json),
-        Commands::Query { sql, file, format, json } => {
-            let fmt = if json { "json".to_string() } else { format };
-            query::run(sql.as_deref(), file.as_deref(), &fmt)
+        Commands::Query { sql, file, format, json, raw, params } => {
+            let fmt = if json {
+                "json".to_string()
+            } else if raw {
+                "raw".to_string()
+            } else {
+                format
+            };
+            query::run(sql.as_deref(), file.as_deref(), &fmt, &params, stdin_available)
+        }
+        Commands::Tag { tags, ids, replace, json } => {
+            tag::run(&tags, ids, replace, json, stdin_available)
         }
-        Commands::Tag { tags, ids, replace, json } => tag::run(&tags, ids, replace, json),
         Commands::Backup { command } => backup::run(command),
         Commands::Compact { skip_backup, json } => compact::run(skip_backup, json),
         Commands::Doctor { verbose, json } => doctor::run(verbose, json),
@@ -169,5 +200,9 @@ fn run(cli: Cli) -> Result<()> {
         Commands::Demo { command } => demo::run(command),
         Commands::Plugin { command } => plugin::run(command),
         Commands::Logs { command } => logs::run(command),
+        Commands::Repl => repl::run(|argv| {
+            let cli = Cli::try_parse_from(std::iter::once("tl".to_string()).chain(argv))?;
+            run(cli, false)
+        }),
     }
 }
@@ -1,13 +1,16 @@
 //! DuckDB repository implementation
 
-use std::fs::{File, OpenOptions};
+use std::fs::{self, File, OpenOptions};
 use std::path::{Path, PathBuf};
+use std::str::FromStr;
 use std::sync::Mutex;
 
 use fs2::FileExt;
 
 use anyhow::{anyhow, Context, Result};
 use chrono::{DateTime, NaiveDate, NaiveDateTime, Utc};
+use duckdb::arrow::array::{Array, StringArray};
+use duckdb::types::ValueRef;
 use duckdb::{params, Connection};
 use rust_decimal::Decimal;
 use sqlparser::dialect::DuckDbDialect;
@@ -837,6 +840,42 @@ impl DuckDbRepository {
         Ok(tx)
     }
 
+    /// Fetch a batch of transactions by id in one query
+    ///
+    /// Equivalent to calling get_transaction_by_id per id, but issues a
+    /// single IN-list query; ids with no matching row are simply absent
+    /// from the result.
+    pub fn get_transactions_by_ids(&self, ids: &[Uuid]) -> Result<Vec<Transaction>> {
+        if ids.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let conn = self.conn.lock().unwrap();
+
+        // Build IN clause with UUIDs - see get_transactions_matching_rule()
+        let id_list: Vec<String> = ids.iter().map(|id| format!("'{}'", id)).collect();
+        let in_clause = id_list.join(", ");
+
+        // CAST(tags AS VARCHAR) required - see get_transactions() for explanation
+        let sql = format!(
+            "SELECT transaction_id, account_id, amount, description, transaction_date::VARCHAR,
+                    posted_date::VARCHAR, CAST(tags AS VARCHAR) as tags, external_ids, deleted_at, parent_transaction_id,
+                    created_at, updated_at, csv_fingerprint, csv_batch_id, is_manual, tags_auto_applied,
+                    sf_id, sf_posted, sf_amount, sf_description, sf_transacted_at, sf_pending, sf_extra,
+                    lf_id, lf_account_id, lf_amount, lf_currency, lf_date::VARCHAR, lf_merchant, lf_description, lf_is_pending
+             FROM sys_transactions WHERE transaction_id IN ({})",
+            in_clause
+        );
+
+        let mut stmt = conn.prepare(&sql)?;
+        let txs = stmt
+            .query_map([], |row| self.row_to_transaction(row))?
+            .filter_map(|r| r.ok())
+            .collect();
+
+        Ok(txs)
+    }
+
     // === Balance snapshot operations ===
 
     pub fn add_balance_snapshot(&self, snapshot: &BalanceSnapshot) -> Result<()> {
@@ -943,7 +982,8 @@ impl DuckDbRepository {
 
     // === Query operations ===
 
-    pub fn execute_query(&self, sql: &str) -> Result<QueryResult> {
+    /// Validate that a query is read-only (SELECT/WITH, no write keywords)
+    fn ensure_read_only_query(sql: &str) -> Result<()> {
         // Validate it's a read-only query by checking SQL statement type
         // Only look at the first word after stripping whitespace/comments
         let sql_trimmed = sql.trim();
@@ -985,6 +1025,12 @@ impl DuckDbRepository {
             }
         }
 
+        Ok(())
+    }
+
+    pub fn execute_query(&self, sql: &str) -> Result<QueryResult> {
+        Self::ensure_read_only_query(sql)?;
+
         let conn = self.conn.lock().unwrap();
         let mut stmt = conn.prepare(sql)?;
 
@@ -1042,6 +1088,20 @@ impl DuckDbRepository {
         })
     }
 
+    /// Execute a read-only query with values bound to ? placeholders
+    ///
+    /// Same read-only validation as `execute_query`; binding values instead
+    /// of interpolating them lets callers reuse one SQL string (and its
+    /// prepared plan) across many invocations.
+    pub fn execute_query_with_params(
+        &self,
+        sql: &str,
+        params: &[serde_json::Value],
+    ) -> Result<QueryResult> {
+        Self::ensure_read_only_query(sql)?;
+        self.execute_sql_with_params(sql, params)
+    }
+
     /// Execute arbitrary SQL (read or write)
     ///
     /// Unlike `execute_query`, this method allows both SELECT and write operations.
@@ -1255,8 +1315,6 @@ impl DuckDbRepository {
     }
 
     fn get_column_value(&self, row: &duckdb::Row, idx: usize) -> serde_json::Value {
-        use duckdb::types::ValueRef;
-
         // Use get_ref to get the raw ValueRef, which handles all types including arrays
         match row.get_ref(idx) {
             Ok(ValueRef::Null) => serde_json::Value::Null,
@@ -1275,7 +1333,6 @@ impl DuckDbRepository {
             Ok(ValueRef::Decimal(d)) => {
                 // Convert Decimal to f64 for JSON compatibility
                 // This matches the old Arrow-based behavior
-                use std::str::FromStr;
                 let s = d.to_string();
                 match f64::from_str(&s) {
                     Ok(f) => serde_json::json!(f),
@@ -1328,8 +1385,6 @@ impl DuckDbRepository {
     }
 
     fn list_to_json(&self, list_type: &duckdb::types::ListType, idx: usize) -> serde_json::Value {
-        use duckdb::arrow::array::{Array, StringArray};
-
         // Get the list array and extract values at the given index
         match list_type {
             duckdb::types::ListType::Regular(arr) => {
@@ -1382,8 +1437,6 @@ impl DuckDbRepository {
         arr: &duckdb::arrow::array::StructArray,
         idx: usize,
     ) -> serde_json::Value {
-        use duckdb::arrow::array::Array;
-
         if arr.is_null(idx) {
             return serde_json::Value::Null;
         }
@@ -1454,8 +1507,6 @@ impl DuckDbRepository {
     // === Maintenance operations ===
 
     pub fn compact(&self) -> Result<()> {
-        use std::fs;
-
         // Note: We already hold the filesystem lock for the repository lifetime,
         // so no additional locking is needed here.
 
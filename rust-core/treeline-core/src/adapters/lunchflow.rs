@@ -11,6 +11,7 @@ use anyhow::{Context, Result};
 use chrono::{NaiveDate, Utc};
 use reqwest::blocking::Client;
 use rust_decimal::Decimal;
+use serde::de::Error;
 use serde::{Deserialize, Serialize};
 use serde_json::Value as JsonValue;
 use uuid::Uuid;
@@ -101,7 +102,6 @@ fn deserialize_id<'de, D>(deserializer: D) -> std::result::Result<String, D::Err
 where
     D: serde::Deserializer<'de>,
 {
-    use serde::de::Error;
     let value: JsonValue = Deserialize::deserialize(deserializer)?;
     match value {
         JsonValue::Number(n) => Ok(n.to_string()),
@@ -115,7 +115,6 @@ fn deserialize_optional_id<'de, D>(deserializer: D) -> std::result::Result<Optio
 where
     D: serde::Deserializer<'de>,
 {
-    use serde::de::Error;
     let value: Option<JsonValue> = Option::deserialize(deserializer)?;
     match value {
         Some(JsonValue::Number(n)) => Ok(Some(n.to_string())),
@@ -130,7 +129,6 @@ fn deserialize_amount<'de, D>(deserializer: D) -> std::result::Result<Decimal, D
 where
     D: serde::Deserializer<'de>,
 {
-    use serde::de::Error;
     let value: JsonValue = Deserialize::deserialize(deserializer)?;
     match value {
         JsonValue::Number(n) => {
@@ -9,20 +9,63 @@
 //! }
 //! ```
 
-use std::collections::HashMap;
-use std::path::Path;
+use std::collections::BTreeMap;
+use std::io::Read;
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::time::SystemTime;
 
 use anyhow::Result;
 use serde::{Deserialize, Serialize};
 
+/// Cached parse of settings.json, keyed by (path, mtime, size).
+///
+/// A single invocation loads the config several times (demo-mode checks,
+/// context creation, encryption key derivation); the cache turns the repeat
+/// loads into a clone of the already-parsed file instead of another disk
+/// read + JSON parse. An external write bumps mtime/size, so stale entries
+/// are never served.
+struct SettingsCache {
+    path: PathBuf,
+    mtime: SystemTime,
+    size: u64,
+    raw: SettingsFile,
+}
+
+static SETTINGS_CACHE: Mutex<Option<SettingsCache>> = Mutex::new(None);
+
+/// Drop the cached settings parse, forcing the next load to re-read the file.
+///
+/// Only needed by tests that rewrite settings.json out-of-band.
+pub fn invalidate_settings_cache() {
+    *SETTINGS_CACHE.lock().unwrap() = None;
+}
+
+/// Path of settings.json inside the treeline directory
+fn settings_path(treeline_dir: &Path) -> PathBuf {
+    treeline_dir.join("settings.json")
+}
+
+/// Parse the TREELINE_DEMO_MODE override (used by CI/testing)
+fn demo_mode_env_override() -> Option<bool> {
+    match std::env::var("TREELINE_DEMO_MODE").ok().as_deref() {
+        Some("true" | "1" | "yes" | "TRUE" | "YES") => Some(true),
+        Some("false" | "0" | "no" | "FALSE" | "NO") => Some(false),
+        _ => None,
+    }
+}
+
 /// Raw settings.json structure (matching Python/App format)
 #[derive(Debug, Clone, Default, Serialize, Deserialize)]
 #[serde(rename_all = "camelCase")]
 struct SettingsFile {
     #[serde(default)]
     app: AppSettings,
-    #[serde(default)]
-    plugins: serde_json::Value,
+    /// Opaque to the CLI; kept as a raw JSON span so loading the config
+    /// doesn't materialize a Value tree for the (potentially large) plugin
+    /// settings it never looks at.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    plugins: Option<Box<serde_json::value::RawValue>>,
     #[serde(default)]
     import_profiles: ImportProfilesContainer,
     #[serde(default)]
@@ -34,24 +77,28 @@ struct SettingsFile {
 struct AppSettings {
     #[serde(default)]
     demo_mode: bool,
+    /// BTreeMap, not HashMap: save() compares serialized bytes against the
+    /// on-disk file to skip no-op writes, so key order must be stable
+    /// across processes (HashMap iteration order is randomly seeded).
     #[serde(flatten)]
-    other: HashMap<String, serde_json::Value>,
+    other: BTreeMap<String, serde_json::Value>,
 }
 
 #[derive(Debug, Clone, Default, Serialize, Deserialize)]
 #[serde(rename_all = "camelCase")]
 struct ImportProfilesContainer {
+    // BTreeMaps for deterministic serialization - see AppSettings::other
     #[serde(default)]
-    profiles: HashMap<String, ImportProfile>,
+    profiles: BTreeMap<String, ImportProfile>,
     #[serde(default)]
-    account_mappings: HashMap<String, String>,
+    account_mappings: BTreeMap<String, String>,
 }
 
 /// Treeline configuration (simplified view of settings)
 #[derive(Debug, Clone)]
 pub struct Config {
     pub demo_mode: bool,
-    pub import_profiles: HashMap<String, ImportProfile>,
+    pub import_profiles: BTreeMap<String, ImportProfile>,
     // Keep the raw settings for preservation when saving
     _raw_settings: SettingsFile,
 }
@@ -60,7 +107,7 @@ impl Default for Config {
     fn default() -> Self {
         Self {
             demo_mode: false,
-            import_profiles: HashMap::new(),
+            import_profiles: BTreeMap::new(),
             _raw_settings: SettingsFile::default(),
         }
     }
@@ -73,25 +120,57 @@ impl Config {
     /// 1. Settings file (tl demo on)
     /// 2. Environment variable TREELINE_DEMO_MODE (for CI/testing)
     pub fn load(treeline_dir: &Path) -> Result<Self> {
-        let settings_path = treeline_dir.join("settings.json");
+        let settings_path = settings_path(treeline_dir);
 
-        let raw: SettingsFile = if settings_path.exists() {
-            let content = std::fs::read_to_string(&settings_path)?;
-            serde_json::from_str(&content).unwrap_or_default()
-        } else {
-            SettingsFile::default()
+        // Open once and stat/read through the same descriptor: one path
+        // lookup instead of the previous metadata + read pair, and no window
+        // for the file to change between the stat and the read.
+        let mut raw: SettingsFile = match std::fs::File::open(&settings_path) {
+            Ok(mut file) => {
+                let meta = file.metadata()?;
+                let mtime = meta.modified().unwrap_or(SystemTime::UNIX_EPOCH);
+                let size = meta.len();
+                let mut cache = SETTINGS_CACHE.lock().unwrap();
+                match cache.as_ref() {
+                    Some(c) if c.path == settings_path && c.mtime == mtime && c.size == size => {
+                        c.raw.clone()
+                    }
+                    _ => {
+                        let raw: SettingsFile = if size < 2 {
+                            // First-run and truncated files can't hold a real
+                            // settings object (the minimum is "{}"); skip the
+                            // read and the parser startup cost entirely.
+                            SettingsFile::default()
+                        } else {
+                            // Parse straight from bytes: skips the UTF-8
+                            // validation pass and the intermediate String
+                            // allocation of read_to_string + from_str.
+                            let mut content = Vec::with_capacity(size as usize);
+                            file.read_to_end(&mut content)?;
+                            serde_json::from_slice(&content).unwrap_or_default()
+                        };
+                        *cache = Some(SettingsCache {
+                            path: settings_path,
+                            mtime,
+                            size,
+                            raw: raw.clone(),
+                        });
+                        raw
+                    }
+                }
+            }
+            Err(_) => SettingsFile::default(),
         };
 
         // Check env var for demo mode override (for CI/testing)
-        let demo_mode = match std::env::var("TREELINE_DEMO_MODE").ok().as_deref() {
-            Some("true" | "1" | "yes" | "TRUE" | "YES") => true,
-            Some("false" | "0" | "no" | "FALSE" | "NO") => false,
-            _ => raw.app.demo_mode,
-        };
+        let demo_mode = demo_mode_env_override().unwrap_or(raw.app.demo_mode);
 
         Ok(Self {
             demo_mode,
-            import_profiles: raw.import_profiles.profiles.clone(),
+            // Move the profiles out instead of deep-cloning the map; the
+            // retained raw settings only exist for field preservation and
+            // save() re-reads the file before writing anyway.
+            import_profiles: std::mem::take(&mut raw.import_profiles.profiles),
             _raw_settings: raw,
         })
     }
@@ -99,25 +178,77 @@ impl Config {
     /// Save config to treeline directory
     /// Preserves other settings that the CLI doesn't manage
     pub fn save(&self, treeline_dir: &Path) -> Result<()> {
-        let settings_path = treeline_dir.join("settings.json");
+        let settings_path = settings_path(treeline_dir);
 
         // Load existing settings to preserve fields we don't manage
-        let mut settings = if settings_path.exists() {
-            let content = std::fs::read_to_string(&settings_path)?;
-            serde_json::from_str::<SettingsFile>(&content).unwrap_or_default()
-        } else {
-            SettingsFile::default()
-        };
+        let existing = std::fs::read(&settings_path).ok();
+        let mut settings = existing
+            .as_deref()
+            .and_then(|bytes| serde_json::from_slice::<SettingsFile>(bytes).ok())
+            .unwrap_or_default();
 
         // Update only the fields we manage
         settings.app.demo_mode = self.demo_mode;
         settings.import_profiles.profiles = self.import_profiles.clone();
 
-        let content = serde_json::to_string_pretty(&settings)?;
-        std::fs::write(&settings_path, content)?;
+        // settings.json is machine-written; compact output roughly halves
+        // the bytes and the serialization work. TREELINE_PRETTY_SETTINGS=1
+        // restores the indented layout for anyone editing the file by hand.
+        let content = if std::env::var_os("TREELINE_PRETTY_SETTINGS").is_some() {
+            serde_json::to_vec_pretty(&settings)?
+        } else {
+            serde_json::to_vec(&settings)?
+        };
+
+        // No-op saves (e.g. enabling demo mode when it is already on)
+        // serialize to the same bytes; skip the write and rename entirely.
+        if existing.as_deref() == Some(content.as_slice()) {
+            return Ok(());
+        }
+
+        // Write to a sibling tmp file and rename into place. Writing the
+        // target directly truncates it first, so a crash mid-save leaves a
+        // corrupt settings.json and the next load silently falls back to
+        // defaults, dropping every stored import profile.
+        let tmp_path = settings_path.with_extension("json.tmp");
+        std::fs::write(&tmp_path, content)?;
+        std::fs::rename(&tmp_path, &settings_path)?;
+
+        // Refresh the cache in place so the next load after a save is free.
+        if let Ok(meta) = std::fs::metadata(&settings_path) {
+            *SETTINGS_CACHE.lock().unwrap() = Some(SettingsCache {
+                path: settings_path,
+                mtime: meta.modified().unwrap_or(SystemTime::UNIX_EPOCH),
+                size: meta.len(),
+                raw: settings,
+            });
+        }
         Ok(())
     }
 
+    /// Load, apply a mutation, and save in one step
+    ///
+    /// Centralizes the load/mutate/save round-trip the mutating callers all
+    /// repeat. The load comes from the settings cache when warm, and save()
+    /// already skips the disk write when the mutation turns out to be a
+    /// no-op, so callers need no change detection of their own.
+    pub fn update(treeline_dir: &Path, f: impl FnOnce(&mut Self)) -> Result<()> {
+        let mut config = Self::load(treeline_dir).unwrap_or_default();
+        f(&mut config);
+        config.save(treeline_dir)
+    }
+
+    /// Check demo mode without materializing the full config
+    ///
+    /// The TREELINE_DEMO_MODE override is consulted first, so the common
+    /// CI/testing case answers without touching settings.json at all.
+    pub fn is_demo_mode(treeline_dir: &Path) -> Result<bool> {
+        if let Some(enabled) = demo_mode_env_override() {
+            return Ok(enabled);
+        }
+        Ok(Self::load(treeline_dir)?.demo_mode)
+    }
+
     /// Enable demo mode
     pub fn enable_demo_mode(&mut self) {
         self.demo_mode = true;
@@ -180,3 +311,91 @@ impl Default for ColumnMappings {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Write settings.json by hand and drop the cache so load() re-reads it
+    fn write_settings(treeline_dir: &Path, content: &str) {
+        std::fs::write(settings_path(treeline_dir), content).unwrap();
+        invalidate_settings_cache();
+    }
+
+    #[test]
+    fn test_load_missing_file_defaults() {
+        let dir = tempfile::tempdir().unwrap();
+        let config = Config::load(dir.path()).unwrap();
+        assert!(!config.demo_mode);
+        assert!(config.import_profiles.is_empty());
+    }
+
+    #[test]
+    fn test_save_and_load_round_trip() {
+        let dir = tempfile::tempdir().unwrap();
+        Config::update(dir.path(), |config| config.enable_demo_mode()).unwrap();
+        assert!(Config::load(dir.path()).unwrap().demo_mode);
+        assert!(Config::is_demo_mode(dir.path()).unwrap());
+
+        Config::update(dir.path(), |config| config.disable_demo_mode()).unwrap();
+        assert!(!Config::load(dir.path()).unwrap().demo_mode);
+    }
+
+    #[test]
+    fn test_noop_save_skips_rewrite() {
+        let dir = tempfile::tempdir().unwrap();
+        // Several unmanaged app keys and account mappings: the skip check
+        // compares serialized bytes, so their key order must be stable
+        // across saves for repeat no-ops to short-circuit.
+        write_settings(
+            dir.path(),
+            r#"{"app":{"demoMode":false,"zeta":1,"alpha":2,"theme":"dark"},
+                "importProfiles":{"profiles":{},"accountMappings":{"b":"2","a":"1"}}}"#,
+        );
+
+        // First save normalizes the layout (compact, sorted keys)...
+        Config::update(dir.path(), |config| config.enable_demo_mode()).unwrap();
+        let settings_path = settings_path(dir.path());
+        let bytes = std::fs::read(&settings_path).unwrap();
+        let mtime = std::fs::metadata(&settings_path).unwrap().modified().unwrap();
+
+        // ...after which repeated no-op saves must not touch the file.
+        for _ in 0..10 {
+            Config::update(dir.path(), |config| config.enable_demo_mode()).unwrap();
+            assert_eq!(std::fs::read(&settings_path).unwrap(), bytes);
+            assert_eq!(
+                std::fs::metadata(&settings_path).unwrap().modified().unwrap(),
+                mtime,
+                "no-op save rewrote settings.json"
+            );
+        }
+    }
+
+    #[test]
+    fn test_save_preserves_unmanaged_fields() {
+        let dir = tempfile::tempdir().unwrap();
+        write_settings(
+            dir.path(),
+            r#"{"app":{"demoMode":false,"theme":"dark"},
+                "plugins":{"some-plugin":{"nested":{"keep":true}}},
+                "disabledPlugins":["old-plugin"],
+                "importProfiles":{"profiles":{},"accountMappings":{"acct":"profile"}}}"#,
+        );
+
+        Config::update(dir.path(), |config| config.enable_demo_mode()).unwrap();
+
+        let saved: serde_json::Value =
+            serde_json::from_slice(&std::fs::read(settings_path(dir.path())).unwrap()).unwrap();
+        assert_eq!(saved["app"]["demoMode"], serde_json::json!(true));
+        assert_eq!(saved["app"]["theme"], serde_json::json!("dark"));
+        assert_eq!(
+            saved["plugins"]["some-plugin"]["nested"]["keep"],
+            serde_json::json!(true)
+        );
+        assert_eq!(saved["disabledPlugins"], serde_json::json!(["old-plugin"]));
+        assert_eq!(
+            saved["importProfiles"]["accountMappings"]["acct"],
+            serde_json::json!("profile")
+        );
+    }
+}
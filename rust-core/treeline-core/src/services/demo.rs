@@ -28,8 +28,7 @@ impl DemoService {
 
     /// Check if demo mode is currently enabled
     pub fn is_enabled(&self) -> Result<bool> {
-        let config = Config::load(&self.treeline_dir)?;
-        Ok(config.demo_mode)
+        Config::is_demo_mode(&self.treeline_dir)
     }
 
     /// Enable demo mode
@@ -50,9 +49,7 @@ impl DemoService {
         }
 
         // Enable demo mode in config
-        let mut config = Config::load(&self.treeline_dir).unwrap_or_default();
-        config.enable_demo_mode();
-        config.save(&self.treeline_dir)?;
+        Config::update(&self.treeline_dir, |config| config.enable_demo_mode())?;
 
         // Create demo database and populate with data
         let repository = Arc::new(DuckDbRepository::new(&demo_db, None)?);
@@ -86,9 +83,7 @@ impl DemoService {
     /// 2. Optionally delete demo database (if clean = true)
     pub fn disable(&self, clean: bool) -> Result<()> {
         // Disable demo mode in config
-        let mut config = Config::load(&self.treeline_dir).unwrap_or_default();
-        config.disable_demo_mode();
-        config.save(&self.treeline_dir)?;
+        Config::update(&self.treeline_dir, |config| config.disable_demo_mode())?;
 
         // Optionally clean up demo database
         if clean {
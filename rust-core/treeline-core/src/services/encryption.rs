@@ -8,6 +8,7 @@ use std::path::PathBuf;
 use anyhow::{Context, Result};
 use base64::Engine;
 use duckdb::Connection;
+use rand::Rng;
 use serde::Serialize;
 
 use crate::domain::{EncryptionMetadata, EncryptionStatus};
@@ -125,7 +126,6 @@ impl EncryptionService {
         let backup = backup_service.create(None)?;
 
         // Generate salt (16 bytes like Python)
-        use rand::Rng;
         let salt: [u8; 16] = rand::thread_rng().gen();
         let salt_b64 = base64::engine::general_purpose::STANDARD.encode(&salt);
 
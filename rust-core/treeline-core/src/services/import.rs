@@ -1,6 +1,8 @@
 //! Import service - CSV transaction import
 
 use std::collections::HashMap;
+use std::fs::File;
+use std::io::{BufRead, BufReader};
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
@@ -74,7 +76,7 @@ impl ImportService {
     }
 
     /// List saved import profiles
-    pub fn list_profiles(&self) -> Result<std::collections::HashMap<String, ImportProfile>> {
+    pub fn list_profiles(&self) -> Result<std::collections::BTreeMap<String, ImportProfile>> {
         let config = Config::load(&self.treeline_dir)?;
         Ok(config.import_profiles)
     }
@@ -98,8 +100,6 @@ impl ImportService {
         // Read CSV with optional row skipping
         let (headers, records) = if options.skip_rows > 0 {
             // Use raw reader to skip rows before header
-            use std::fs::File;
-            use std::io::{BufRead, BufReader};
 
             let file = File::open(file_path).context("Failed to open CSV file")?;
             let buf_reader = BufReader::new(file);
@@ -546,21 +546,20 @@ impl ImportService {
         mappings: &ColumnMappings,
         options: &ImportOptions,
     ) -> Result<()> {
-        let mut config = Config::load(&self.treeline_dir)?;
-        config.import_profiles.insert(
-            name.to_string(),
-            ImportProfile {
-                column_mappings: mappings.clone(),
-                date_format: None,
-                skip_rows: 0,
-                options: ConfigImportOptions {
-                    flip_signs: options.flip_signs,
-                    debit_negative: options.debit_negative,
+        Config::update(&self.treeline_dir, |config| {
+            config.import_profiles.insert(
+                name.to_string(),
+                ImportProfile {
+                    column_mappings: mappings.clone(),
+                    date_format: None,
+                    skip_rows: 0,
+                    options: ConfigImportOptions {
+                        flip_signs: options.flip_signs,
+                        debit_negative: options.debit_negative,
+                    },
                 },
-            },
-        );
-        config.save(&self.treeline_dir)?;
-        Ok(())
+            );
+        })
     }
 
     /// Get a saved profile
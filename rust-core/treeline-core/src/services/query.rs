@@ -21,6 +21,62 @@ impl QueryService {
         self.repository.execute_query(sql)
     }
 
+    /// Execute a `;`-separated script of read-only queries
+    ///
+    /// Returns one result per statement, so callers can batch several
+    /// queries into a single invocation (one process start and database
+    /// open) instead of paying that overhead per statement.
+    pub fn execute_script(&self, sql: &str) -> Result<Vec<QueryResult>> {
+        Self::split_statements(sql)
+            .into_iter()
+            .map(|stmt| self.repository.execute_query(stmt))
+            .collect()
+    }
+
+    /// Split a script into statements on `;`, ignoring quoted semicolons
+    ///
+    /// Tracks single- and double-quoted regions so a literal like
+    /// `SELECT ';'` stays one statement. SQL escapes quotes by doubling
+    /// them ('' / ""), which toggles the state twice and needs no special
+    /// handling. Empty statements (trailing `;`, blank segments) are
+    /// dropped.
+    pub fn split_statements(sql: &str) -> Vec<&str> {
+        let mut statements = Vec::new();
+        let mut start = 0;
+        let mut in_single = false;
+        let mut in_double = false;
+
+        for (i, c) in sql.char_indices() {
+            match c {
+                '\'' if !in_double => in_single = !in_single,
+                '"' if !in_single => in_double = !in_double,
+                ';' if !in_single && !in_double => {
+                    let stmt = sql[start..i].trim();
+                    if !stmt.is_empty() {
+                        statements.push(stmt);
+                    }
+                    start = i + 1;
+                }
+                _ => {}
+            }
+        }
+
+        let tail = sql[start..].trim();
+        if !tail.is_empty() {
+            statements.push(tail);
+        }
+        statements
+    }
+
+    /// Execute a read-only query with values bound to ? placeholders
+    pub fn execute_with_params(
+        &self,
+        sql: &str,
+        params: &[serde_json::Value],
+    ) -> Result<QueryResult> {
+        self.repository.execute_query_with_params(sql, params)
+    }
+
     /// Execute arbitrary SQL (read or write)
     ///
     /// For SELECT queries, returns columns and rows.
@@ -40,3 +96,55 @@ impl QueryService {
         self.repository.execute_sql_with_params(sql, params)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_split_statements_basic() {
+        assert_eq!(
+            QueryService::split_statements("SELECT 1; SELECT 2;"),
+            vec!["SELECT 1", "SELECT 2"]
+        );
+    }
+
+    #[test]
+    fn test_split_statements_single_statement_unchanged() {
+        assert_eq!(
+            QueryService::split_statements("SELECT COUNT(*) FROM transactions"),
+            vec!["SELECT COUNT(*) FROM transactions"]
+        );
+    }
+
+    #[test]
+    fn test_split_statements_ignores_quoted_semicolons() {
+        // A semicolon inside a string literal is not a statement boundary
+        assert_eq!(
+            QueryService::split_statements("SELECT ';' AS c"),
+            vec!["SELECT ';' AS c"]
+        );
+        assert_eq!(
+            QueryService::split_statements("SELECT \";\" FROM t; SELECT 'a;b'"),
+            vec!["SELECT \";\" FROM t", "SELECT 'a;b'"]
+        );
+    }
+
+    #[test]
+    fn test_split_statements_handles_doubled_quotes() {
+        // SQL escapes a quote by doubling it; the ; stays inside the literal
+        assert_eq!(
+            QueryService::split_statements("SELECT 'it''s;fine' AS c"),
+            vec!["SELECT 'it''s;fine' AS c"]
+        );
+    }
+
+    #[test]
+    fn test_split_statements_drops_empty_segments() {
+        assert_eq!(
+            QueryService::split_statements("; SELECT 1 ;; \n"),
+            vec!["SELECT 1"]
+        );
+        assert!(QueryService::split_statements("  ").is_empty());
+    }
+}
@@ -71,28 +71,28 @@ impl TagService {
 
             rules_matched += 1;
 
-            // Apply tags to each matching transaction (additive)
-            for tx_id in &matching_tx_ids {
-                // Get existing tags
-                if let Some(tx) = self.repository.get_transaction_by_id(&tx_id.to_string())? {
-                    let mut tags = tx.tags;
-
-                    // Merge new tags (additive, no duplicates)
-                    let mut changed = false;
-                    for tag in &rule.tags {
-                        if !tags.contains(tag) {
-                            tags.push(tag.clone());
-                            changed = true;
-                        }
-                    }
+            // Fetch all matched transactions in one query rather than one
+            // lookup per id - rules routinely match most of a sync batch,
+            // and the per-id round trips dominated this loop.
+            for tx in self.repository.get_transactions_by_ids(&matching_tx_ids)? {
+                let tx_id = tx.id;
+                let mut tags = tx.tags;
 
-                    // Update if we added new tags (and mark as auto-applied)
-                    if changed {
-                        self.repository
-                            .update_transaction_tags_auto(&tx_id.to_string(), &tags)?;
-                        transactions_tagged_set.insert(*tx_id);
+                // Merge new tags (additive, no duplicates)
+                let mut changed = false;
+                for tag in &rule.tags {
+                    if !tags.contains(tag) {
+                        tags.push(tag.clone());
+                        changed = true;
                     }
                 }
+
+                // Update if we added new tags (and mark as auto-applied)
+                if changed {
+                    self.repository
+                        .update_transaction_tags_auto(&tx_id.to_string(), &tags)?;
+                    transactions_tagged_set.insert(tx_id);
+                }
             }
         }
 
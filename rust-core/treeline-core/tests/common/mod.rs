@@ -0,0 +1,29 @@
+//! Shared helpers for integration tests
+
+use std::path::PathBuf;
+use std::sync::OnceLock;
+
+use tempfile::TempDir;
+
+/// Create a temp directory for a test, preferring tmpfs when available
+///
+/// Test databases are ephemeral and DuckDB setup is write-heavy, so backing
+/// test directories with memory (/dev/shm on Linux) instead of disk avoids
+/// the fsync traffic that otherwise dominates IO-bound tests. Falls back to
+/// the system temp directory where /dev/shm is absent or not writable.
+pub fn temp_dir() -> TempDir {
+    static TMP_ROOT: OnceLock<Option<PathBuf>> = OnceLock::new();
+    let root = TMP_ROOT.get_or_init(|| {
+        if !cfg!(target_os = "linux") {
+            return None;
+        }
+        let shm = PathBuf::from("/dev/shm");
+        // Probe writability once; containers sometimes mount /dev/shm read-only
+        (shm.is_dir() && TempDir::new_in(&shm).is_ok()).then_some(shm)
+    });
+
+    match root {
+        Some(root) => TempDir::new_in(root).expect("Failed to create temp dir"),
+        None => TempDir::new().expect("Failed to create temp dir"),
+    }
+}
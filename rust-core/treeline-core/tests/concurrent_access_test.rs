@@ -11,12 +11,13 @@ use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::{Arc, Barrier};
 use std::thread;
 use std::time::{Duration, Instant};
-use tempfile::TempDir;
 use uuid::Uuid;
 
 use treeline_core::adapters::duckdb::DuckDbRepository;
 use treeline_core::domain::Account;
 
+mod common;
+
 /// Number of concurrent threads for stress tests.
 /// Keep this realistic - in production we'd have at most a few processes
 /// (app + CLI + maybe another CLI command) competing for the lock.
@@ -40,7 +41,7 @@ fn create_test_account(suffix: &str) -> Account {
 /// Expected behavior AFTER fix: All operations serialize via file lock
 #[test]
 fn test_concurrent_repository_instances_writing() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_concurrent.duckdb");
 
     // Create initial database with schema
@@ -142,7 +143,7 @@ fn test_concurrent_repository_instances_writing() {
 /// while another command is reading accounts for display.
 #[test]
 fn test_concurrent_read_write_operations() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_read_write.duckdb");
 
     // Create initial database with some data
@@ -229,7 +230,7 @@ fn test_concurrent_read_write_operations() {
 /// creates and destroys a TreelineContext.
 #[test]
 fn test_rapid_connection_churn() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_churn.duckdb");
 
     // Create initial database
@@ -295,7 +296,7 @@ fn test_rapid_connection_churn() {
 /// while sync tries to access the database.
 #[test]
 fn test_schema_operations_during_data_access() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_schema.duckdb");
 
     // Create database WITHOUT running migrations
@@ -381,7 +382,7 @@ fn test_schema_operations_during_data_access() {
 /// to maximize contention.
 #[test]
 fn test_high_contention_writes() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_contention.duckdb");
 
     // Create initial database
@@ -467,7 +468,7 @@ fn test_high_contention_writes() {
 /// is still readable and consistent.
 #[test]
 fn test_database_integrity_after_concurrent_ops() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_integrity.duckdb");
 
     // Create initial database
@@ -537,7 +538,7 @@ fn test_database_integrity_after_concurrent_ops() {
 /// One thread runs migrations while another attempts sync-like operations.
 #[test]
 fn test_startup_race_condition() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_startup.duckdb");
 
     // DON'T initialize the database - let threads race to do it
@@ -644,7 +645,7 @@ fn test_stress_repeated_concurrent_access() {
     for iteration in 0..STRESS_ITERATIONS {
         println!("\n=== Stress Iteration {} ===", iteration + 1);
 
-        let temp_dir = TempDir::new().unwrap();
+        let temp_dir = common::temp_dir();
         let db_path = temp_dir
             .path()
             .join(format!("test_stress_{}.duckdb", iteration));
@@ -711,7 +712,7 @@ fn test_stress_repeated_concurrent_access() {
 /// This tests the lock under heavy write load.
 #[test]
 fn test_concurrent_bulk_writes() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_bulk_writes.duckdb");
 
     // Create initial database
@@ -802,7 +803,7 @@ fn test_concurrent_bulk_writes() {
 /// Simulates real-world usage where UI reads while sync writes.
 #[test]
 fn test_mixed_heavy_workload() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_mixed_workload.duckdb");
 
     let prepop_count = 20;
@@ -949,7 +950,7 @@ fn test_mixed_heavy_workload() {
 /// This is exactly how the Tauri app currently works.
 #[test]
 fn test_rapid_open_write_close_cycle() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_rapid_cycle.duckdb");
 
     let thread_count = 4;
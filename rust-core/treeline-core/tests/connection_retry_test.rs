@@ -5,14 +5,15 @@
 use std::sync::{Arc, Barrier};
 use std::thread;
 use std::time::{Duration, Instant};
-use tempfile::TempDir;
 
 use treeline_core::adapters::duckdb::DuckDbRepository;
 
+mod common;
+
 /// Test that concurrent connection attempts work with retry logic
 #[test]
 fn test_concurrent_connections() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test.duckdb");
 
     // Create initial database
@@ -85,7 +86,7 @@ fn test_concurrent_connections() {
 /// The retry logic primarily helps on Windows where file locking is stricter.
 #[test]
 fn test_sequential_connections() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test_sequential.duckdb");
 
     // Open and close connections multiple times
@@ -5,8 +5,8 @@
 //!
 //! Run with: cargo test --test integration_tests -- --nocapture
 
-use std::path::Path;
-use std::sync::Arc;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, OnceLock};
 use tempfile::TempDir;
 use uuid::Uuid;
 
@@ -17,18 +17,43 @@ use treeline_core::adapters::duckdb::DuckDbRepository;
 use treeline_core::config::ColumnMappings;
 use treeline_core::domain::{Account, BalanceSnapshot, Transaction};
 use treeline_core::services::{
-    BackupService, ImportOptions, ImportService, NumberFormat, TagService,
+    BackupService, ImportOptions, ImportService, NumberFormat, QueryService, TagService,
 };
 
+mod common;
+
 // ============================================================================
 // Test Helpers
 // ============================================================================
 
+/// Template database with the schema already applied, built once per process.
+///
+/// ensure_schema replays the full migration set; paying that in every test
+/// dominates setup time, so tests copy the finished template file instead.
+/// The template lives under cargo's per-target test scratch directory, not a
+/// TempDir: a TempDir held in a static never runs Drop, which would leak a
+/// directory per run. Cargo owns this path and `cargo clean` removes it.
+static SCHEMA_TEMPLATE: OnceLock<PathBuf> = OnceLock::new();
+
 /// Create a test repository with schema initialized
 fn create_test_repo(temp_dir: &TempDir) -> Arc<DuckDbRepository> {
+    let template_path = SCHEMA_TEMPLATE.get_or_init(|| {
+        let dir = PathBuf::from(env!("CARGO_TARGET_TMPDIR"));
+        std::fs::create_dir_all(&dir).expect("Failed to create template dir");
+        let path = dir.join("schema_template.duckdb");
+        // Remove a stale template from a previous run - the schema may have
+        // changed since it was built
+        let _ = std::fs::remove_file(&path);
+        let repo = DuckDbRepository::new(&path, None).expect("Failed to create repository");
+        repo.ensure_schema().expect("Failed to initialize schema");
+        // Close the connection so the template is fully checkpointed on disk
+        drop(repo);
+        path
+    });
+
     let db_path = temp_dir.path().join("test.duckdb");
+    std::fs::copy(template_path, &db_path).expect("Failed to copy schema template");
     let repo = DuckDbRepository::new(&db_path, None).expect("Failed to create repository");
-    repo.ensure_schema().expect("Failed to initialize schema");
     Arc::new(repo)
 }
 
@@ -60,7 +85,7 @@ fn create_balance_snapshot(account_id: Uuid, balance: Decimal) -> BalanceSnapsho
 /// Test that delete_account is atomic - all or nothing
 #[test]
 fn test_delete_account_removes_all_related_data() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Create account with transactions and balance snapshots
@@ -106,7 +131,7 @@ fn test_delete_account_removes_all_related_data() {
 /// Test that delete_account doesn't leave orphaned data on partial failure
 #[test]
 fn test_delete_account_no_orphans_on_nonexistent_account() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Create some accounts and transactions first
@@ -139,7 +164,7 @@ fn test_delete_account_no_orphans_on_nonexistent_account() {
 /// Test that deleting one account doesn't affect another account's data
 #[test]
 fn test_delete_account_isolation() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Create two accounts with transactions
@@ -189,7 +214,7 @@ fn test_delete_account_isolation() {
 /// Test that backup includes all data and can be listed
 #[test]
 fn test_backup_create_and_list() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Add some data
@@ -224,7 +249,7 @@ fn test_backup_create_and_list() {
 /// Test backup retention policy
 #[test]
 fn test_backup_retention_policy() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     let backup_service = BackupService::new_with_repository(
@@ -256,7 +281,7 @@ fn test_backup_retention_policy() {
 /// Test backup restore
 #[test]
 fn test_backup_restore() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let db_path = temp_dir.path().join("test.duckdb");
 
     // Create initial state
@@ -321,7 +346,7 @@ fn test_backup_restore() {
 /// Test applying tags to transactions
 #[test]
 fn test_tag_apply_to_transactions() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
     let tag_service = TagService::new(repo.clone());
 
@@ -353,7 +378,7 @@ fn test_tag_apply_to_transactions() {
 /// Test tag merging (additive)
 #[test]
 fn test_tag_merge_additive() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
     let tag_service = TagService::new(repo.clone());
 
@@ -390,7 +415,7 @@ fn test_tag_merge_additive() {
 /// Test tag replacement
 #[test]
 fn test_tag_replace() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
     let tag_service = TagService::new(repo.clone());
 
@@ -427,7 +452,7 @@ fn test_tag_replace() {
 /// Test applying tags to invalid transaction ID
 #[test]
 fn test_tag_invalid_transaction_id() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
     let tag_service = TagService::new(repo.clone());
 
@@ -448,7 +473,7 @@ fn test_tag_invalid_transaction_id() {
 /// Test CSV import with valid data
 #[test]
 fn test_csv_import_valid_data() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Create account for import
@@ -522,7 +547,7 @@ fn test_csv_import_valid_data() {
 /// Test CSV import deduplication
 #[test]
 fn test_csv_import_deduplication() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     let account = create_test_account("Dedup Test Account");
@@ -595,7 +620,7 @@ fn test_csv_import_deduplication() {
 /// Test that invalid UUIDs in queries are handled properly
 #[test]
 fn test_invalid_uuid_handling() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Query with invalid UUID should return None, not error
@@ -616,7 +641,7 @@ fn test_invalid_uuid_handling() {
 /// Test transaction date range query
 #[test]
 fn test_transaction_date_range() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     let account = create_test_account("Date Range Test");
@@ -641,10 +666,45 @@ fn test_transaction_date_range() {
     assert!(range.latest.unwrap().contains("2024-12-31"));
 }
 
+/// Test batch fetch by id matches the per-id lookup
+#[test]
+fn test_get_transactions_by_ids() {
+    let temp_dir = common::temp_dir();
+    let repo = create_test_repo(&temp_dir);
+
+    let account = create_test_account("Batch Fetch Test");
+    repo.upsert_account(&account).unwrap();
+
+    let date = NaiveDate::from_ymd_opt(2024, 3, 1).unwrap();
+    let mut tx_ids = Vec::new();
+    for i in 0..4 {
+        let tx = create_test_transaction(account.id, (i + 1) * 1000, date);
+        tx_ids.push(tx.id);
+        repo.upsert_transaction(&tx).unwrap();
+    }
+
+    // Fetch a subset plus an id with no matching row
+    let mut requested = vec![tx_ids[0], tx_ids[2], Uuid::new_v4()];
+    let fetched = repo.get_transactions_by_ids(&requested).unwrap();
+    assert_eq!(fetched.len(), 2, "missing ids are simply absent");
+    for tx in &fetched {
+        assert!(requested.contains(&tx.id));
+        let individual = repo
+            .get_transaction_by_id(&tx.id.to_string())
+            .unwrap()
+            .unwrap();
+        assert_eq!(individual.amount, tx.amount);
+        assert_eq!(individual.tags, tx.tags);
+    }
+
+    requested.clear();
+    assert!(repo.get_transactions_by_ids(&requested).unwrap().is_empty());
+}
+
 /// Test balance snapshot ordering
 #[test]
 fn test_balance_snapshot_ordering() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     let account = create_test_account("Balance Test");
@@ -674,7 +734,7 @@ fn test_balance_snapshot_ordering() {
 /// Test transaction deduplication by provider ID
 #[test]
 fn test_sync_deduplication_by_provider_id() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     let account = create_test_account("Dedup Test");
@@ -696,7 +756,7 @@ fn test_sync_deduplication_by_provider_id() {
 /// Test Lunchflow ID deduplication
 #[test]
 fn test_sync_deduplication_by_lunchflow_id() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     let account = create_test_account("LF Dedup Test");
@@ -722,7 +782,7 @@ fn test_sync_deduplication_by_lunchflow_id() {
 /// Test executing custom SQL queries
 #[test]
 fn test_execute_custom_query() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Create test data
@@ -749,7 +809,7 @@ fn test_execute_custom_query() {
 /// Test query validation rejects dangerous SQL
 #[test]
 fn test_query_validation() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // Invalid SQL should return error
@@ -757,6 +817,64 @@ fn test_query_validation() {
     assert!(result.is_err(), "Invalid SQL should fail");
 }
 
+/// Test batch script execution returns one result per statement
+#[test]
+fn test_execute_script_returns_result_per_statement() {
+    let temp_dir = common::temp_dir();
+    let repo = create_test_repo(&temp_dir);
+    let query_service = QueryService::new(repo);
+
+    let results = query_service
+        .execute_script("SELECT 1 AS a; SELECT 2 AS b;")
+        .unwrap();
+    assert_eq!(results.len(), 2);
+    assert_eq!(results[0].rows[0][0], serde_json::json!(1));
+    assert_eq!(results[1].rows[0][0], serde_json::json!(2));
+}
+
+/// Test that a single statement with a semicolon in a literal is not split
+#[test]
+fn test_execute_script_semicolon_in_literal() {
+    let temp_dir = common::temp_dir();
+    let repo = create_test_repo(&temp_dir);
+    let query_service = QueryService::new(repo);
+
+    let results = query_service.execute_script("SELECT ';' AS c").unwrap();
+    assert_eq!(results.len(), 1);
+    assert_eq!(results[0].rows[0][0], serde_json::json!(";"));
+}
+
+/// Test parameterized read-only queries bind values to ? placeholders
+#[test]
+fn test_execute_with_params() {
+    let temp_dir = common::temp_dir();
+    let repo = create_test_repo(&temp_dir);
+
+    let account = create_test_account("Param Test");
+    repo.upsert_account(&account).unwrap();
+    let date = NaiveDate::from_ymd_opt(2024, 1, 15).unwrap();
+    for i in 0..3 {
+        let tx = create_test_transaction(account.id, (i + 1) * 1000, date);
+        repo.upsert_transaction(&tx).unwrap();
+    }
+
+    let query_service = QueryService::new(repo);
+    let result = query_service
+        .execute_with_params(
+            "SELECT COUNT(*) AS cnt FROM sys_transactions WHERE amount > ?",
+            &[serde_json::json!(15.0)],
+        )
+        .unwrap();
+    assert_eq!(result.rows[0][0], serde_json::json!(2));
+
+    // The parameterized path keeps the read-only guarantee
+    let result = query_service.execute_with_params(
+        "DELETE FROM sys_transactions WHERE amount > ?",
+        &[serde_json::json!(0)],
+    );
+    assert!(result.is_err(), "write statements must be rejected");
+}
+
 // ============================================================================
 // DuckDB Command Tests
 // ============================================================================
@@ -768,7 +886,7 @@ fn test_query_validation() {
 /// This is critical for plugin migrations which use CHECKPOINT after DDL
 #[test]
 fn test_checkpoint_command_execution() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // CHECKPOINT should succeed (it's a valid DuckDB command)
@@ -783,7 +901,7 @@ fn test_checkpoint_command_execution() {
 /// Test that VACUUM command can be executed via execute_sql
 #[test]
 fn test_vacuum_command_execution() {
-    let temp_dir = TempDir::new().unwrap();
+    let temp_dir = common::temp_dir();
     let repo = create_test_repo(&temp_dir);
 
     // VACUUM should succeed